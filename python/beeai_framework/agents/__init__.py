@@ -15,6 +15,6 @@
 
 from beeai_framework.agents.base import BaseAgent
 from beeai_framework.agents.errors import AgentError
-from beeai_framework.agents.types import AgentExecutionConfig, AgentMeta
+from beeai_framework.agents.types import AgentExecutionConfig, AgentMeta, ExecutionPreset
 
-__all__ = ["AgentError", "AgentExecutionConfig", "AgentMeta", "BaseAgent"]
+__all__ = ["AgentError", "AgentExecutionConfig", "AgentMeta", "BaseAgent", "ExecutionPreset"]
@@ -13,16 +13,19 @@
 # limitations under the License.
 
 
+import asyncio
 from abc import ABC, abstractmethod
+from hashlib import blake2b
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
+from beeai_framework.agents.errors import AgentError
 from beeai_framework.agents.types import AgentExecutionConfig, AgentMeta
 from beeai_framework.cancellation import AbortSignal
 from beeai_framework.context import Run, RunContext, RunContextInput, RunInstance
 from beeai_framework.emitter import Emitter
-from beeai_framework.memory import BaseMemory
+from beeai_framework.memory import BaseCache, BaseMemory
 from beeai_framework.utils.models import ModelLike
 
 TInput = TypeVar("TInput", bound=BaseModel)
@@ -31,8 +34,21 @@ TOutput = TypeVar("TOutput", bound=BaseModel)
 
 
 class BaseAgent(ABC, Generic[TInput, TOptions, TOutput]):
-    is_running: bool = False
     emitter: Emitter
+    run_cache: BaseCache[TOutput] | None = None
+    # class-level fallbacks for subclasses that do not call super().__init__()
+    _is_running: bool = False
+    _loop: asyncio.AbstractEventLoop | None = None
+    _inflight: dict[str, "asyncio.Future[TOutput]"] | None = None
+
+    def __init__(self) -> None:
+        self._is_running = False
+        self._loop = None
+        self._inflight = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
 
     def run(
         self,
@@ -40,25 +56,75 @@ class BaseAgent(ABC, Generic[TInput, TOptions, TOutput]):
         execution: AgentExecutionConfig | None = None,
         signal: AbortSignal | None = None,
     ) -> Run[TOutput]:
-        if self.is_running:
-            raise RuntimeError("Agent is already running!")
+        loop = self._cached_loop()
+        cache = self.run_cache if self.run_cache is not None and self.run_cache.enabled else None
+        cache_key = self._run_cache_key(prompt) if cache is not None and prompt is not None else None
+        context_input = RunContextInput(
+            signal=signal if signal else None,
+            params=({"prompt": prompt}, {"execution": execution, "signal": signal}),
+        )
 
-        self.is_running = True
+        if self._is_running:
+            raise RuntimeError("Agent is already running!")
 
         async def handler(context: RunContext) -> TOutput:
+            # Single-flight: a concurrent run with an identical prompt joins the
+            # in-flight one instead of erroring out (or re-running the
+            # trajectory). Checked here, when execution actually starts, so a
+            # Run that is constructed but never awaited cannot strand joiners
+            # on a future nobody resolves.
+            if cache_key is not None and self._inflight is not None:
+                inflight = self._inflight.get(cache_key)
+                if inflight is not None and not inflight.done():
+                    joined: TOutput = await asyncio.shield(inflight)
+                    # copy so the joiner and the producer's caller never share
+                    # mutable state (memory, iterations, ...)
+                    return joined.model_copy(deep=True)
+
+            if self._is_running:
+                # AgentError (a FrameworkError) propagates untranslated out of
+                # the run context, unlike a bare RuntimeError raised here.
+                raise AgentError("Agent is already running!")
+
+            self._is_running = True
+
+            future: asyncio.Future[TOutput] | None = None
+            if cache_key is not None:
+                if self._inflight is None:
+                    self._inflight = {}
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[cache_key] = future
+
             try:
-                return await self._run({"prompt": prompt}, {"execution": execution, "signal": signal}, context)
+                if cache is not None and cache_key is not None:
+                    cached: TOutput | None = await cache.get(cache_key)
+                    if cached is not None:
+                        if future is not None and not future.done():
+                            future.set_result(cached)
+                        # the cached master stays private: every hit gets its
+                        # own deep copy, like a fresh run would have produced
+                        return cached.model_copy(deep=True)
+
+                output = await self._run({"prompt": prompt}, {"execution": execution, "signal": signal}, context)
+
+                if cache is not None and cache_key is not None:
+                    await cache.set(cache_key, output.model_copy(deep=True))
+
+                if future is not None and not future.done():
+                    future.set_result(output)
+
+                return output
+            except Exception as e:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+                    future.exception()  # mark as retrieved in case nobody joined this run
+                raise
             finally:
-                self.is_running = False
-
-        return RunContext.enter(
-            RunInstance(emitter=self.emitter),
-            RunContextInput(
-                signal=signal if signal else None,
-                params=({"prompt": prompt}, {"execution": execution, "signal": signal}),
-            ),
-            handler,
-        )
+                if cache_key is not None and self._inflight is not None and self._inflight.get(cache_key) is future:
+                    del self._inflight[cache_key]
+                self._is_running = False
+
+        return RunContext.enter(RunInstance(emitter=self.emitter, loop=loop), context_input, handler)
 
     @abstractmethod
     async def _run(
@@ -66,7 +132,40 @@ class BaseAgent(ABC, Generic[TInput, TOptions, TOutput]):
     ) -> TOutput:
         pass
 
+    def _run_cache_key(self, prompt: str) -> str:
+        """Build the run_cache key for a prompt.
+
+        Prompts that differ only in surrounding whitespace or letter case map
+        to the same entry, so trivially re-phrased prompts still hit the cache.
+        The agent's tool names and current memory contents are mixed in, so
+        reconfigured agents never share entries and the same prompt asked
+        later in a conversation does not replay a stale answer.
+        """
+        normalized = " ".join(prompt.split()).casefold()
+        tools = ",".join(sorted(tool.name for tool in self.meta.tools))
+        digest = blake2b(f"{normalized}|{tools}".encode(), digest_size=16)
+        memory = self.memory
+        if memory is not None:
+            for message in memory.messages:
+                digest.update(f"|{message.role}:{message.text}".encode())
+        return digest.hexdigest()
+
+    def _cached_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Reuse the event loop resolved by a previous run of this agent.
+
+        Saves the `get_running_loop` lookup when agents are invoked in tight loops.
+        Returns None when called outside a running loop (the run context resolves it lazily).
+        """
+        if self._loop is None or self._loop.is_closed():
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._loop = None
+        return self._loop
+
     def destroy(self) -> None:
+        self._loop = None
+        self._inflight = None
         self.emitter.destroy()
 
     @property
@@ -37,6 +37,7 @@ from beeai_framework.agents.react.types import (
 from beeai_framework.agents.types import (
     AgentExecutionConfig,
     AgentMeta,
+    ExecutionPreset,
 )
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.backend.message import AssistantMessage, MessageMeta, UserMessage
@@ -61,6 +62,7 @@ class ReActAgent(BaseAgent[ReActAgentRunInput, ReActAgentRunOptions, ReActAgentR
         execution: AgentExecutionConfig | None = None,
         stream: bool | None = None,
     ) -> None:
+        super().__init__()
         self.input = ReActAgentInput(
             llm=llm, tools=tools, memory=memory, meta=meta, templates=templates, execution=execution, stream=stream
         )
@@ -122,11 +124,7 @@ class ReActAgent(BaseAgent[ReActAgentRunInput, ReActAgentRunOptions, ReActAgentR
                 else ReActAgentRunOptions(
                     execution=self.input.execution
                     or (options.execution if options is not None else None)
-                    or AgentExecutionConfig(
-                        max_retries_per_step=3,
-                        total_max_retries=20,
-                        max_iterations=10,
-                    ),
+                    or ExecutionPreset.DEFAULT,
                     signal=None,
                 )
             ),
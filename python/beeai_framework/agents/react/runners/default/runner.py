@@ -307,10 +307,19 @@ class DefaultRunner(BaseRunner):
             )
         ).get()
 
-    async def init_memory(self, input: ReActAgentRunInput) -> BaseMemory:
-        memory = TokenMemory(
-            capacity_threshold=0.85, sync_threshold=0.5, llm=self._input.llm
-        )  # TODO handlers needs to be fixed
+    def system_prompt(self) -> str:
+        """Render the static system prefix (instructions plus tool definitions).
+
+        The result is cached on the agent input, so repeated runs send a
+        byte-identical prefix (keeping provider-side prompt caches warm) and
+        tool schemas are serialized only once per agent. Conversation memory is
+        appended after this prefix so its churn never invalidates it.
+        """
+        fingerprint = tuple(id(tool) for tool in self._input.tools)
+        cached = self._input._system_prompt_cache
+        if cached is not None and cached[0] == fingerprint:
+            prompt: str = cached[1]
+            return prompt
 
         tool_defs = [
             ToolDefinition(
@@ -321,15 +330,22 @@ class DefaultRunner(BaseRunner):
             for tool in self._input.tools
         ]
 
-        system_prompt: str = self.templates.system.render(
+        prompt = self.templates.system.render(
             SystemPromptTemplateInput(
                 tools=tool_defs,
             )
         )
+        self._input._system_prompt_cache = (fingerprint, prompt)
+        return prompt
+
+    async def init_memory(self, input: ReActAgentRunInput) -> BaseMemory:
+        memory = TokenMemory(
+            capacity_threshold=0.85, sync_threshold=0.5, llm=self._input.llm
+        )  # TODO handlers needs to be fixed
 
         await memory.add_many(
             [
-                SystemMessage(content=system_prompt),
+                SystemMessage(content=self.system_prompt()),
                 *self._input.memory.messages,
             ]
         )
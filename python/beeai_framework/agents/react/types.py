@@ -15,7 +15,7 @@
 from collections.abc import Callable
 from typing import Annotated, Any
 
-from pydantic import BaseModel, InstanceOf
+from pydantic import BaseModel, InstanceOf, PrivateAttr
 
 from beeai_framework.agents.types import AgentExecutionConfig, AgentMeta
 from beeai_framework.backend.chat import ChatModel
@@ -93,3 +93,5 @@ class ReActAgentInput(BaseModel):
     templates: dict[ModelKeysType, InstanceOf[PromptTemplate[Any]] | ReActAgentTemplateFactory] | None = None
     execution: AgentExecutionConfig | None = None
     stream: bool | None = None
+    # (fingerprint, rendered prompt) of the static system prefix; managed by the runners
+    _system_prompt_cache: tuple[Any, str] | None = PrivateAttr(default=None)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pydantic import BaseModel, InstanceOf
+from pydantic import BaseModel, ConfigDict, InstanceOf
 
 from beeai_framework.tools.tool import AnyTool
 
@@ -23,6 +23,25 @@ class AgentExecutionConfig(BaseModel):
     max_iterations: int | None = None
 
 
+class _FrozenAgentExecutionConfig(AgentExecutionConfig):
+    """Immutable variant backing the shared presets below."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ExecutionPreset:
+    """Pre-built execution configs for the common retry/iteration budgets.
+
+    Validated once at import and passed through `to_model` untouched, so runs
+    using a preset skip per-call submodel construction. The instances are
+    frozen because they are shared across every caller.
+    """
+
+    FAST = _FrozenAgentExecutionConfig(total_max_retries=2, max_retries_per_step=3, max_iterations=8)
+    DEFAULT = _FrozenAgentExecutionConfig(total_max_retries=20, max_retries_per_step=3, max_iterations=10)
+    THOROUGH = _FrozenAgentExecutionConfig(total_max_retries=40, max_retries_per_step=5, max_iterations=25)
+
+
 class AgentMeta(BaseModel):
     name: str
     description: str
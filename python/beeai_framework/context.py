@@ -39,9 +39,11 @@ logger = Logger(__name__)
 storage: ContextVar["RunContext"] = ContextVar("storage")
 
 
-@dataclass
+# slots: one of these is allocated per run, so skip the per-instance __dict__
+@dataclass(slots=True)
 class RunInstance:
     emitter: Emitter
+    loop: asyncio.AbstractEventLoop | None = None
 
 
 class RunContextInput(BaseModel):
@@ -50,6 +52,8 @@ class RunContextInput(BaseModel):
 
 
 class Run(Generic[R]):
+    __slots__ = ("handler", "run_context", "tasks")
+
     def __init__(self, handler: Callable[[], R | Awaitable[R]], context: "RunContext") -> None:
         super().__init__()
         self.handler = ensure_async(handler)
@@ -90,8 +94,21 @@ class Run(Generic[R]):
 
 
 class RunContext(RunInstance):
+    __slots__ = (
+        "context",
+        "context_input",
+        "controller",
+        "created_at",
+        "group_id",
+        "instance",
+        "parent_id",
+        "run_id",
+        "run_params",
+    )
+
     def __init__(self, *, instance: RunInstance, context_input: RunContextInput, parent: Self | None = None) -> None:
         self.instance = instance
+        self.loop = instance.loop
         self.context_input = context_input
         self.created_at = datetime.now(tz=UTC)
         self.run_params = context_input.params
@@ -124,6 +141,13 @@ class RunContext(RunInstance):
     def signal(self) -> AbortSignal:
         return self.controller.signal
 
+    def _resolve_loop(self) -> asyncio.AbstractEventLoop:
+        # Memoized in the inherited `loop` field so repeated lookups within a
+        # run skip asyncio's TLS machinery.
+        if self.loop is None or self.loop.is_closed():
+            self.loop = asyncio.get_running_loop()
+        return self.loop
+
     def destroy(self) -> None:
         self.emitter.destroy()
         self.controller.abort("Context destroyed.")
@@ -156,7 +180,7 @@ class RunContext(RunInstance):
                     return await fn(context)
 
                 async def _context_signal_aborted() -> None:
-                    cancel_future = asyncio.get_event_loop().create_future()
+                    cancel_future = context._resolve_loop().create_future()
 
                     def _on_abort() -> None:
                         if not cancel_future.done() and not cancel_future.cancelled():
@@ -183,10 +207,14 @@ class RunContext(RunInstance):
                 await emitter.emit("success", result)
                 assert result is not None
                 return result
+            except FrameworkError as fe:
+                # already translated: re-raise bare so the traceback stays intact
+                await emitter.emit("error", {"error": fe})
+                raise
             except Exception as e:
                 error = FrameworkError.ensure(e)
                 await emitter.emit("error", {"error": error})
-                raise error
+                raise error from e
             finally:
                 await emitter.emit("finish", None)
                 context.destroy()
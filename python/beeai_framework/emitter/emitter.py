@@ -17,11 +17,12 @@ import copy
 import functools
 import inspect
 import re
+import sys
 import uuid
 from asyncio import Task
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
-from typing import Any, TypeAlias
+from typing import Any, TypeAlias, cast
 
 from pydantic import BaseModel, ConfigDict, InstanceOf
 
@@ -43,6 +44,8 @@ class Listener(BaseModel):
     match: MatcherFn
     raw: Matcher
     callback: Callback
+    is_async: bool = False  # resolved once at registration, not per emit
+    name: str | None = None  # interned event name for plain single-name matchers
     options: InstanceOf[EmitterOptions] | None = None
 
     model_config = ConfigDict(frozen=True)
@@ -62,6 +65,10 @@ class EventMeta(BaseModel):
 
 
 class Emitter:
+    # Emitters are created per run context (and per child), so keep them off
+    # __dict__ storage; every attribute is assigned in __init__.
+    __slots__ = ("_events", "_pipes", "cleanups", "context", "creator", "group_id", "listeners", "namespace", "trace")
+
     def __init__(
         self,
         group_id: str | None = None,
@@ -74,6 +81,7 @@ class Emitter:
         super().__init__()
 
         self.listeners: set[Listener] = set()
+        self._pipes: list[Emitter] = []
         self.group_id: str | None = group_id
         self.namespace: list[str] = namespace or []
         self.creator: object | None = creator
@@ -121,18 +129,20 @@ class Emitter:
         return child_emitter
 
     def pipe(self, target: "Emitter") -> CleanupFn:
-        return self.on(
-            "*.*",
-            target.invoke,
-            EmitterOptions(
-                is_blocking=True,
-                once=False,
-                persistent=True,
-            ),
-        )
+        # Piped emitters are walked iteratively by invoke() rather than via a
+        # catch-all listener per hop, so deep child()/pipe() chains do not
+        # allocate one `invoke` coroutine per level for every event.
+        self._pipes.append(target)
+
+        def unpipe() -> None:
+            if target in self._pipes:
+                self._pipes.remove(target)
+
+        return unpipe
 
     def destroy(self) -> None:
         self.listeners.clear()
+        self._pipes.clear()
         for cleanup in self.cleanups:
             cleanup()
         self.cleanups.clear()
@@ -180,7 +190,21 @@ class Emitter:
 
             return lambda event: all(match_fn(event) for match_fn in matchers)
 
-        listener = Listener(match=create_matcher(), raw=matcher, callback=callback, options=options)
+        # Plain single-name matchers ("update", "error", ...) record their
+        # interned name so invoke() can reject mismatching events with a
+        # pointer comparison before calling the matcher closure chain.
+        simple_name: str | None = None
+        if isinstance(matcher, str) and matcher not in ("*", "*.*") and "." not in matcher:
+            simple_name = sys.intern(matcher)
+
+        listener = Listener(
+            match=create_matcher(),
+            raw=matcher,
+            callback=callback,
+            is_async=inspect.iscoroutinefunction(callback),
+            name=simple_name,
+            options=options,
+        )
         self.listeners.add(listener)
 
         return lambda: self.listeners.remove(listener)
@@ -193,31 +217,63 @@ class Emitter:
 
     async def invoke(self, data: Any, event: EventMeta) -> None:
         executions: list[Coroutine[Any, Any, Any] | Task[Any]] = []
-        for listener in self.listeners:
-            if not listener.match(event):
-                continue
-
-            if listener.options and listener.options.once:
-                self.listeners.remove(listener)
-
-            async def run(ln: Listener = listener) -> Any:
-                if inspect.iscoroutinefunction(ln.callback):
-                    return await ln.callback(data, event)
+        sync_error: BaseException | None = None
+
+        # Walk this emitter plus every transitively piped one with an explicit
+        # work list instead of recursing emitter-by-emitter.
+        emitters: list[Emitter] = [self]
+        index = 0
+        while index < len(emitters):
+            emitter = emitters[index]
+            index += 1
+
+            for listener in tuple(emitter.listeners):
+                if listener.name is not None and listener.name != event.name:
+                    continue
+                if not listener.match(event):
+                    continue
+
+                if listener.options and listener.options.once:
+                    emitter.listeners.remove(listener)
+
+                # Sync callbacks run inline — no wrapper coroutine, no task, no
+                # scheduler round-trip. Async callbacks skip the wrapper too:
+                # blocking listeners go straight into the gather below while
+                # non-blocking ones (the default) start immediately as tasks.
+                if listener.is_async:
+                    # is_async guarantees the callback returns a coroutine,
+                    # which the Callback alias cannot express
+                    callback = cast(Callable[[Any, EventMeta], Coroutine[Any, Any, None]], listener.callback)
+                    if listener.options and listener.options.is_blocking:
+                        executions.append(callback(data, event))
+                    else:
+                        executions.append(asyncio.create_task(callback(data, event)))
                 else:
-                    return ln.callback(data, event)
-
-            if listener.options and listener.options.is_blocking:
-                executions.append(run())
+                    try:
+                        listener.callback(data, event)
+                    except Exception as e:
+                        # one raising listener must not silence the rest of the
+                        # dispatch (or leak the coroutines collected so far)
+                        if sync_error is None:
+                            sync_error = e
+
+            emitters.extend(emitter._pipes)
+
+        if executions:
+            if sync_error is None:
+                await asyncio.gather(*executions)
             else:
-                executions.append(asyncio.create_task(run()))
-
-        await asyncio.gather(*executions)
+                await asyncio.gather(*executions, return_exceptions=True)
+        if sync_error is not None:
+            raise sync_error
 
     def create_event(self, name: str) -> EventMeta:
         return EventMeta(
             id=str(uuid.uuid4()),
             group_id=self.group_id,
-            name=name,
+            # interned so comparisons against registered listener names are
+            # identity checks in the common case
+            name=sys.intern(name),
             path=".".join([*self.namespace, name]),
             created_at=datetime.now(tz=UTC),
             source=self,
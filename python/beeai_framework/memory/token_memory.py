@@ -46,6 +46,9 @@ class TokenMemory(BaseMemory):
         self.threshold = capacity_threshold
         self.sync_threshold = sync_threshold
         self._tokens_by_message = {}
+        # running aggregates so tokens_used/is_dirty don't rescan every entry
+        self._tokens_total = 0
+        self._dirty_count = 0
 
         self.handlers = {
             "estimate": (handlers.get("estimate", self._default_estimate) if handlers else self._default_estimate),
@@ -66,17 +69,36 @@ class TokenMemory(BaseMemory):
         """Generate a unique key for a message."""
         return f"{message.role}:{message.text}"
 
+    def _set_token_info(self, key: str, tokens_count: int, dirty: bool) -> None:
+        """Insert or replace a token-count entry, keeping the running aggregates in step."""
+        old = self._tokens_by_message.get(key)
+        if old is not None:
+            self._tokens_total -= old.get("tokens_count", 0)
+            self._dirty_count -= 1 if old.get("dirty", True) else 0
+        self._tokens_by_message[key] = {
+            "tokens_count": tokens_count,
+            "dirty": dirty,
+        }
+        self._tokens_total += tokens_count
+        self._dirty_count += 1 if dirty else 0
+
+    def _drop_token_info(self, key: str) -> None:
+        info = self._tokens_by_message.pop(key, None)
+        if info is not None:
+            self._tokens_total -= info.get("tokens_count", 0)
+            self._dirty_count -= 1 if info.get("dirty", True) else 0
+
     @property
     def messages(self) -> list[Message]:
         return self._messages
 
     @property
     def tokens_used(self) -> int:
-        return sum(info.get("tokens_count", 0) for info in self._tokens_by_message.values())
+        return self._tokens_total
 
     @property
     def is_dirty(self) -> bool:
-        return any(info.get("dirty", True) for info in self._tokens_by_message.values())
+        return self._dirty_count > 0
 
     async def sync(self) -> None:
         """Synchronize token counts with LLM."""
@@ -86,16 +108,10 @@ class TokenMemory(BaseMemory):
             if cache.get("dirty", True):
                 try:
                     result = await self.handlers["tokenize"]([msg])
-                    self._tokens_by_message[key] = {
-                        "tokens_count": result,
-                        "dirty": False,
-                    }
+                    self._set_token_info(key, tokens_count=result, dirty=False)
                 except Exception as e:
                     print(f"Error tokenizing message: {e!s}")
-                    self._tokens_by_message[key] = {
-                        "tokens_count": self.handlers["estimate"](msg),
-                        "dirty": True,
-                    }
+                    self._set_token_info(key, tokens_count=self.handlers["estimate"](msg), dirty=True)
 
     async def add(self, message: Message, index: int | None = None) -> None:
         index = len(self._messages) if index is None else max(0, min(index, len(self._messages)))
@@ -103,20 +119,16 @@ class TokenMemory(BaseMemory):
 
         key = self._get_message_key(message)
         estimated_tokens = self.handlers["estimate"](message)
-        self._tokens_by_message[key] = {
-            "tokens_count": estimated_tokens,
-            "dirty": True,
-        }
+        self._set_token_info(key, tokens_count=estimated_tokens, dirty=True)
 
-        dirty_count = sum(1 for info in self._tokens_by_message.values() if info.get("dirty", True))
-        if len(self._messages) > 0 and dirty_count / len(self._messages) >= self.sync_threshold:
+        if len(self._messages) > 0 and self._dirty_count / len(self._messages) >= self.sync_threshold:
             await self.sync()
 
     async def delete(self, message: Message) -> bool:
         try:
             key = self._get_message_key(message)
             self._messages.remove(message)
-            self._tokens_by_message.pop(key, None)
+            self._drop_token_info(key)
             return True
         except ValueError:
             return False
@@ -124,6 +136,8 @@ class TokenMemory(BaseMemory):
     def reset(self) -> None:
         self._messages.clear()
         self._tokens_by_message.clear()
+        self._tokens_total = 0
+        self._dirty_count = 0
 
     def create_snapshot(self) -> dict[str, Any]:
         return {
@@ -134,3 +148,5 @@ class TokenMemory(BaseMemory):
     def load_snapshot(self, state: dict[str, Any]) -> None:
         self._messages = copy(state["messages"])
         self._tokens_by_message = copy(state["token_counts"])
+        self._tokens_total = sum(info.get("tokens_count", 0) for info in self._tokens_by_message.values())
+        self._dirty_count = sum(1 for info in self._tokens_by_message.values() if info.get("dirty", True))
@@ -23,6 +23,7 @@ from beeai_framework.tools import ToolError
 from beeai_framework.tools.search import SearchToolOutput, SearchToolResult
 from beeai_framework.tools.tool import Tool
 from beeai_framework.tools.types import ToolRunOptions
+from beeai_framework.utils.asynchronous import asyncify
 
 logger = Logger(__name__)
 
@@ -65,7 +66,9 @@ class DuckDuckGoSearchTool(Tool[DuckDuckGoSearchToolInput, ToolRunOptions, DuckD
         self, input: DuckDuckGoSearchToolInput, options: ToolRunOptions | None, context: RunContext
     ) -> DuckDuckGoSearchToolOutput:
         try:
-            results = DDGS().text(input.query, max_results=self.max_results, safesearch=self.safe_search)
+            # DDGS is a blocking client; run it off-loop so concurrent tool
+            # calls are not serialized behind this one.
+            results = await asyncify(self._search)(input.query)
             search_results: list[SearchToolResult] = [
                 DuckDuckGoSearchToolResult(
                     title=result.get("title") or "", description=result.get("body") or "", url=result.get("href") or ""
@@ -76,3 +79,7 @@ class DuckDuckGoSearchTool(Tool[DuckDuckGoSearchToolInput, ToolRunOptions, DuckD
 
         except Exception as e:
             raise ToolError("Error performing search:") from e
+
+    def _search(self, query: str) -> list[dict[str, str]]:
+        results: list[dict[str, str]] = DDGS().text(query, max_results=self.max_results, safesearch=self.safe_search)
+        return results
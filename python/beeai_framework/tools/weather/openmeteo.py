@@ -13,9 +13,12 @@
 # limitations under the License.
 
 
+import asyncio
 import json
+import re
 from collections import namedtuple
-from datetime import UTC, datetime
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
 from typing import Any, Literal
 from urllib.parse import urlencode
 
@@ -29,9 +32,35 @@ from beeai_framework.logger import Logger
 from beeai_framework.tools import StringToolOutput, ToolError, ToolInputValidationError
 from beeai_framework.tools.tool import Tool
 from beeai_framework.tools.types import ToolRunOptions
+from beeai_framework.utils.asynchronous import asyncify
 
 logger = Logger(__name__)
 
+# Compiled once at import so per-call validation skips the re module's cache
+# lookup, and malformed dates are rejected without a raise/except round-trip.
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+# Keep-alive clients shared by every OpenMeteoTool instance so repeated calls
+# reuse the same TCP/TLS connection instead of paying a handshake each time.
+# Keyed by event loop: connections must never be reused across asyncio.run()
+# boundaries, and entries for closed loops are pruned on access.
+_shared_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        for stale_loop in [cached for cached in _shared_clients if cached.is_closed()]:
+            del _shared_clients[stale_loop]
+        client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        _shared_clients[loop] = client
+    return client
+
 
 class OpenMeteoToolInput(BaseModel):
     location_name: str = Field(description="The name of the location to retrieve weather information.")
@@ -83,6 +112,14 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, StringToolOutput]):
         return geocode
 
     def get_params(self, input: OpenMeteoToolInput) -> dict[str, Any]:
+        params = self._base_params(input)
+
+        geocode = self._geocode(input)
+        params["latitude"] = geocode.get("latitude", "")
+        params["longitude"] = geocode.get("longitude", "")
+        return params
+
+    def _base_params(self, input: OpenMeteoToolInput) -> dict[str, Any]:
         params = {
             "current": ",".join(
                 [
@@ -96,10 +133,6 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, StringToolOutput]):
             "timezone": "UTC",
         }
 
-        geocode = self._geocode(input)
-        params["latitude"] = geocode.get("latitude", "")
-        params["longitude"] = geocode.get("longitude", "")
-
         Dates = namedtuple("Dates", ["start_date", "end_date"])
 
         def _validate_and_set_dates(start_date: str | None, end_date: str | None) -> Dates:
@@ -110,18 +143,29 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, StringToolOutput]):
             start, end = None, None
 
             if start_date:
+                trimmed = _trim_date(start_date)
+                if _ISO_DATE.match(trimmed) is None:
+                    raise ToolInputValidationError(
+                        "'start_date' is incorrectly formatted, please use the correct format YYYY-MM-DD."
+                    )
                 try:
-                    start = datetime.strptime(_trim_date(start_date), "%Y-%m-%d").replace(tzinfo=UTC)
+                    # date.fromisoformat is C-accelerated and avoids strptime's format-string machinery
+                    start = date.fromisoformat(trimmed)
                 except ValueError as e:
                     raise ToolInputValidationError(
                         "'start_date' is incorrectly formatted, please use the correct format YYYY-MM-DD.", cause=e
                     )
             else:
-                start = datetime.now(UTC)
+                start = datetime.now(UTC).date()
 
             if end_date:
+                trimmed = _trim_date(end_date)
+                if _ISO_DATE.match(trimmed) is None:
+                    raise ToolInputValidationError(
+                        "'end_date' is incorrectly formatted, please use the correct format YYYY-MM-DD."
+                    )
                 try:
-                    end = datetime.strptime(_trim_date(end_date), "%Y-%m-%d").replace(tzinfo=UTC)
+                    end = date.fromisoformat(trimmed)
                 except ValueError as e:
                     raise ToolInputValidationError(
                         "'end_date' is incorrectly formatted, please use the correct format YYYY-MM-DD."
@@ -131,9 +175,9 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, StringToolOutput]):
                     raise ToolInputValidationError("'end_date' must fall on or after 'start_date'.") from None
 
             else:
-                end = datetime.now(UTC)
+                end = datetime.now(UTC).date()
 
-            return Dates(start_date=start.strftime("%Y-%m-%d"), end_date=end.strftime("%Y-%m-%d"))
+            return Dates(start_date=start.isoformat(), end_date=end.isoformat())
 
         dates = _validate_and_set_dates(start_date=input.start_date, end_date=input.end_date)
 
@@ -142,16 +186,51 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, StringToolOutput]):
         params["temperature_unit"] = input.temperature_unit
         return params
 
+    async def run_many(self, inputs: Sequence[OpenMeteoToolInput | dict[str, Any]]) -> list[StringToolOutput]:
+        """Fetch forecasts for many locations in a single forecast request.
+
+        Locations are geocoded concurrently and then coalesced into one HTTP GET
+        (the forecast API accepts comma-separated latitude/longitude lists), so
+        N locations cost one TCP/TLS round-trip instead of N. Inputs that differ
+        in dates or temperature unit cannot share a request and are grouped into
+        one request per parameter set. Outputs come back in input order.
+        """
+        validated = [self.validate_input(input) for input in inputs]
+        geocodes = await asyncio.gather(*(asyncify(self._geocode)(input) for input in validated))
+
+        groups: dict[tuple[tuple[str, Any], ...], list[int]] = {}
+        base_params: list[dict[str, Any]] = []
+        for index, input in enumerate(validated):
+            params = self._base_params(input)
+            base_params.append(params)
+            groups.setdefault(tuple(sorted(params.items())), []).append(index)
+
+        results: list[StringToolOutput | None] = [None] * len(validated)
+        client = _shared_client()
+        for indexes in groups.values():
+            params = dict(base_params[indexes[0]])
+            params["latitude"] = ",".join(str(geocodes[index].get("latitude", "")) for index in indexes)
+            params["longitude"] = ",".join(str(geocodes[index].get("longitude", "")) for index in indexes)
+
+            encoded_params = urlencode(params, doseq=True)
+            logger.debug(f"Using OpenMeteo URL: https://api.open-meteo.com/v1/forecast?{encoded_params}")
+
+            response = await client.get(f"https://api.open-meteo.com/v1/forecast?{encoded_params}")
+            response.raise_for_status()
+            payload = response.json()
+            series = payload if isinstance(payload, list) else [payload]
+            for index, data in zip(indexes, series, strict=True):
+                results[index] = StringToolOutput(json.dumps(data))
+
+        return [result for result in results if result is not None]
+
     async def _run(
         self, input: OpenMeteoToolInput, options: ToolRunOptions | None, context: RunContext
     ) -> StringToolOutput:
-        params = urlencode(self.get_params(input), doseq=True)
+        # get_params geocodes with a blocking HTTP client, so keep it off-loop.
+        params = urlencode(await asyncify(self.get_params)(input), doseq=True)
         logger.debug(f"Using OpenMeteo URL: https://api.open-meteo.com/v1/forecast?{params}")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://api.open-meteo.com/v1/forecast?{params}",
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-            )
-            response.raise_for_status()
-            return StringToolOutput(json.dumps(response.json()))
+        response = await _shared_client().get(f"https://api.open-meteo.com/v1/forecast?{params}")
+        response.raise_for_status()
+        return StringToolOutput(json.dumps(response.json()))
@@ -15,11 +15,57 @@
 import asyncio
 import functools
 import inspect
+import os
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
 
 T = TypeVar("T")
 
+_blocking_executor: ThreadPoolExecutor | None = None
+
+
+def blocking_executor() -> ThreadPoolExecutor:
+    """Lazily-created thread pool shared by all asyncify() wrappers."""
+    global _blocking_executor
+    if _blocking_executor is None:
+        _blocking_executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="beeai-blocking",
+        )
+    return _blocking_executor
+
+
+def asyncify(fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Wrap a blocking callable so awaiting it runs it on the shared thread pool.
+
+    Blocking I/O (e.g. a synchronous HTTP client) inside a coroutine stalls the
+    event loop and serializes everything scheduled with asyncio.gather; wrapped
+    calls run off-loop so concurrent tools overlap instead.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(blocking_executor(), functools.partial(fn, *args, **kwargs))
+
+    return wrapper
+
+
+def use_eager_task_factory(loop: asyncio.AbstractEventLoop | None = None) -> bool:
+    """Execute new tasks eagerly (inline until their first suspension) on the given loop.
+
+    Coroutines that finish without awaiting real I/O then skip a scheduler
+    round-trip entirely. Requires Python 3.12+; returns False (and leaves the
+    loop untouched) on older interpreters.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return False
+
+    (loop or asyncio.get_running_loop()).set_task_factory(factory)
+    return True
+
 
 def ensure_async(fn: Callable[..., T | Awaitable[T]]) -> Callable[..., Awaitable[T]]:
     if asyncio.iscoroutinefunction(fn):
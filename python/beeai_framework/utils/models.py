@@ -24,9 +24,66 @@ from pydantic_core import CoreSchema, SchemaValidator
 T = TypeVar("T", bound=BaseModel)
 ModelLike = Union[T, dict[str, Any]]  # noqa: UP007
 
+_FREEZABLE_TYPES = (str, int, float, bool, bytes)
+_MODEL_CACHE_MAX_SIZE = 128
+
+_model_cache: dict[tuple[type[BaseModel], Any], BaseModel] = {}
+_cacheable_models: dict[type[BaseModel], bool] = {}
+
+
+def _is_cacheable(cls: type[BaseModel]) -> bool:
+    """Models with default factories (timestamps, uuids, fresh containers) must re-run them per call."""
+    cacheable = _cacheable_models.get(cls)
+    if cacheable is None:
+        cacheable = all(field.default_factory is None for field in cls.model_fields.values())
+        _cacheable_models[cls] = cacheable
+    return cacheable
+
+
+def _freeze(obj: Any) -> Any:
+    """Turn plain literals (nested dicts/lists of scalars) into a hashable key, or None when not possible."""
+    if obj is None:
+        return None
+    if isinstance(obj, _FREEZABLE_TYPES):
+        return (type(obj), obj)  # the type tag keeps e.g. True and 1 apart
+    if isinstance(obj, dict):
+        items = []
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                return None
+            frozen = _freeze(value)
+            if frozen is None and value is not None:
+                return None
+            items.append((key, frozen))
+        return (dict, tuple(sorted(items)))
+    if isinstance(obj, list | tuple):
+        frozen_items = tuple(_freeze(value) for value in obj)
+        if any(frozen is None and value is not None for frozen, value in zip(frozen_items, obj, strict=True)):
+            return None
+        return (list, frozen_items)
+    return None
+
 
 def to_model(cls: type[T], obj: ModelLike[T]) -> T:
-    return obj if isinstance(obj, cls) else cls.model_validate(obj, strict=False, from_attributes=True)
+    if isinstance(obj, cls):
+        return obj
+
+    # Repeated literal dicts (e.g. a hard-coded execution config passed on every
+    # run) skip the validator traversal after the first call.
+    if isinstance(obj, dict) and _is_cacheable(cls):
+        key = _freeze(obj)
+        if key is not None:
+            cached = _model_cache.get((cls, key))
+            if cached is None:
+                cached = cls.model_validate(obj, strict=False, from_attributes=True)
+                if len(_model_cache) >= _MODEL_CACHE_MAX_SIZE:
+                    _model_cache.clear()
+                _model_cache[cls, key] = cached
+            # deep copy: nested containers must stay private to each caller,
+            # matching what a fresh model_validate would have produced
+            return cached.model_copy(deep=True)  # type: ignore[return-value]
+
+    return cls.model_validate(obj, strict=False, from_attributes=True)
 
 
 def to_any_model(classes: Sequence[type[BaseModel]], obj: ModelLike[T]) -> Any:
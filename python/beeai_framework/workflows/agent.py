@@ -13,9 +13,10 @@
 # limitations under the License.
 
 import asyncio
+import inspect
 import random
 import string
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from inspect import isfunction
 from typing import Any, Self
 
@@ -30,12 +31,15 @@ from beeai_framework.agents.types import (
 )
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.backend.message import AnyMessage, AssistantMessage
-from beeai_framework.context import Run
+from beeai_framework.context import Run, RunContext, RunContextInput, RunInstance
+from beeai_framework.errors import FrameworkError
 from beeai_framework.memory import BaseMemory, ReadOnlyMemory, UnconstrainedMemory
 from beeai_framework.template import PromptTemplateInput
 from beeai_framework.tools.tool import AnyTool
 from beeai_framework.utils.asynchronous import ensure_async
-from beeai_framework.workflows.types import WorkflowRun
+from beeai_framework.utils.models import check_model
+from beeai_framework.workflows.errors import WorkflowError
+from beeai_framework.workflows.types import WorkflowRun, WorkflowStepRes
 from beeai_framework.workflows.workflow import Workflow
 
 AgentFactory = Callable[[ReadOnlyMemory], AnyAgent | Awaitable[AnyAgent]]
@@ -60,12 +64,16 @@ class Schema(BaseModel):
 class AgentWorkflow:
     def __init__(self, name: str = "AgentWorkflow") -> None:
         self.workflow = Workflow(name=name, schema=Schema)
+        self._dependencies: dict[str, list[str] | None] = {}
 
     def run(self, messages: list[AnyMessage]) -> Run[WorkflowRun[Any, Any]]:
+        if any(dependencies is not None for dependencies in self._dependencies.values()):
+            return self._run_parallel(Schema(messages=messages))
         return self.workflow.run(Schema(messages=messages))
 
     def del_agent(self, name: str) -> "AgentWorkflow":
         self.workflow.delete_step(name)
+        self._dependencies.pop(name, None)
         return self
 
     def add_agent(
@@ -74,6 +82,8 @@ class AgentWorkflow:
             AnyAgent | Callable[[ReadOnlyMemory], AnyAgent | asyncio.Future[AnyAgent]] | AgentFactoryInput | None
         ) = None,
         /,
+        *,
+        depends_on: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> "AgentWorkflow":
         if not agent:
@@ -94,11 +104,11 @@ class AgentWorkflow:
                 instance.memory = memory
                 return instance
 
-            return self._add(agent.meta.name, factory)
+            return self._add(agent.meta.name, factory, depends_on=depends_on)
 
         random_string = "".join(random.choice(string.ascii_letters) for _ in range(4))
         name = agent.name if not callable(agent) else f"Agent{random_string}"
-        return self._add(name, agent if callable(agent) else self._create_factory(agent))
+        return self._add(name, agent if callable(agent) else self._create_factory(agent), depends_on=depends_on)
 
     def _create_factory(self, agent_input: AgentFactoryInput) -> AgentFactory:
         def factory(memory: BaseMemory) -> ReActAgent:
@@ -118,7 +128,88 @@ class AgentWorkflow:
 
         return factory
 
-    def _add(self, name: str, factory: AgentFactory) -> Self:
+    def _run_parallel(self, state: Schema) -> Run[WorkflowRun[Any, Any]]:
+        layers = self._topological_layers()
+
+        async def run_workflow(context: RunContext) -> WorkflowRun[Any, Any]:
+            run = WorkflowRun[Any, Any](state=state)
+
+            for layer in layers:
+                # Each step in the layer works on its own snapshot so parallel
+                # siblings never observe each other's partial output.
+                step_results: list[WorkflowStepRes[Any, Any]] = []
+                for name in layer:
+                    await context.emitter.emit("start", {"run": run, "step": name})
+                    step_results.append(WorkflowStepRes[Any, Any](name=name, state=run.state.model_copy(deep=True)))
+                run.steps.extend(step_results)
+
+                async def execute(step_res: WorkflowStepRes[Any, Any]) -> None:
+                    try:
+                        handler = self.workflow.steps[step_res.name].handler
+                        if inspect.iscoroutinefunction(handler):
+                            await handler(step_res.state)
+                        else:
+                            await asyncio.to_thread(handler, step_res.state)
+                        check_model(step_res.state)
+                    except Exception as e:
+                        err = FrameworkError.ensure(e)
+                        await context.emitter.emit(
+                            "error",
+                            {"run": run.model_copy(), "step": step_res.name, "error": err},
+                        )
+                        raise err from None
+
+                base_count = len(run.state.new_messages)
+                await asyncio.gather(*(execute(step_res) for step_res in step_results))
+
+                # Reduce in declaration order so the merged state (and thereby
+                # final_answer) stays deterministic regardless of finish order.
+                for step_res in step_results:
+                    run.state.new_messages.extend(step_res.state.new_messages[base_count:])
+                    run.state.final_answer = step_res.state.final_answer
+                    await context.emitter.emit(
+                        "success",
+                        {
+                            "run": run.model_copy(),
+                            "state": run.state,
+                            "step": self.workflow.steps[step_res.name],
+                            "next": Workflow.END if layer is layers[-1] else Workflow.NEXT,
+                        },
+                    )
+
+            return run
+
+        return RunContext.enter(
+            RunInstance(emitter=self.workflow.emitter),
+            RunContextInput(params=[state, None], signal=None),
+            run_workflow,
+        )
+
+    def _topological_layers(self) -> list[list[str]]:
+        """Group steps into layers where every step only depends on earlier layers.
+
+        Steps added without ``depends_on`` have no dependencies and land in the
+        first layer; siblings within a layer run concurrently.
+        """
+        remaining = {name: set(self._dependencies.get(name) or []) for name in self.workflow.step_names}
+        for name, dependencies in remaining.items():
+            unknown = dependencies - remaining.keys()
+            if unknown:
+                raise WorkflowError(f"Step '{name}' depends on unknown step(s): {', '.join(sorted(unknown))}.")
+
+        layers: list[list[str]] = []
+        resolved: set[str] = set()
+        while remaining:
+            layer = [name for name, dependencies in remaining.items() if dependencies <= resolved]
+            if not layer:
+                raise WorkflowError(f"Cyclic 'depends_on' dependencies detected: {', '.join(remaining)}.")
+            layers.append(layer)
+            resolved.update(layer)
+            for name in layer:
+                del remaining[name]
+        return layers
+
+    def _add(self, name: str, factory: AgentFactory, depends_on: Sequence[str] | None = None) -> Self:
         async def step(state: Schema) -> None:
             memory = UnconstrainedMemory()
             for message in state.messages + state.new_messages:
@@ -132,4 +223,5 @@ class AgentWorkflow:
             )
 
         self.workflow.add_step(name, step)
+        self._dependencies[name] = list(depends_on) if depends_on is not None else None
         return self
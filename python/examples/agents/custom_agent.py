@@ -37,6 +37,7 @@ class CustomAgent(BaseAgent[ReActAgentRunInput, ReActAgentRunOptions, RunOutput]
     memory: BaseMemory | None = None
 
     def __init__(self, llm: ChatModel, memory: BaseMemory) -> None:
+        super().__init__()
         self.model = llm
         self.memory = memory
 
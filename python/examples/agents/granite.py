@@ -2,18 +2,26 @@ import asyncio
 import sys
 import traceback
 
+try:
+    import uvloop  # speeds up the event loop (optional dependency)
+except ModuleNotFoundError:
+    uvloop = None
+
 from beeai_framework.agents.react.agent import ReActAgent
 from beeai_framework.agents.react.types import ReActAgentRunOutput
-from beeai_framework.agents.types import AgentExecutionConfig
+from beeai_framework.agents.types import ExecutionPreset
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.errors import FrameworkError
 from beeai_framework.memory.unconstrained_memory import UnconstrainedMemory
 from beeai_framework.tools.search import DuckDuckGoSearchTool
 from beeai_framework.tools.weather.openmeteo import OpenMeteoTool
+from beeai_framework.utils.asynchronous import use_eager_task_factory
 from examples.helpers.io import ConsoleReader
 
 
 async def main() -> None:
+    use_eager_task_factory()
+
     chat_model: ChatModel = ChatModel.from_name("ollama:granite3.1-dense:8b")
 
     agent = ReActAgent(
@@ -24,9 +32,7 @@ async def main() -> None:
 
     prompt = reader.prompt()
 
-    output: ReActAgentRunOutput = await agent.run(
-        prompt=prompt, execution=AgentExecutionConfig(total_max_retries=2, max_retries_per_step=3, max_iterations=8)
-    ).on(
+    output: ReActAgentRunOutput = await agent.run(prompt=prompt, execution=ExecutionPreset.FAST).on(
         "update",
         lambda data, event: reader.write(f"Agent({data['update']['key']}) 🤖 : ", data["update"]["parsedValue"]),
     )
@@ -36,6 +42,8 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
+        if uvloop is not None:
+            uvloop.install()
         asyncio.run(main())
     except FrameworkError as e:
         traceback.print_exc()
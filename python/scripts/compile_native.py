@@ -0,0 +1,44 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compile the framework's hot async plumbing with mypyc (opt-in, local only).
+
+BaseAgent.run, the RunContext.enter trampoline and the emitter dispatch loop are
+pure-Python code executed on every agent step; mypyc removes most of their
+interpreter overhead. The published wheel stays pure Python — run this script
+(or `poe compile-native`) in a dev checkout to benchmark or to build a native
+local install. The produced extension modules shadow the .py sources and are
+picked up automatically; `poe clean` removes them.
+"""
+
+import subprocess
+import sys
+
+# Modules on the per-run hot path. Keep this list small: every entry must stay
+# mypyc-clean under the strict settings from pyproject.toml.
+HOT_MODULES = [
+    "beeai_framework/agents/base.py",
+    "beeai_framework/context.py",
+    "beeai_framework/emitter/types.py",
+    "beeai_framework/emitter/utils.py",
+]
+
+
+def main(argv: list[str]) -> int:
+    command = [sys.executable, "-m", "mypyc", *HOT_MODULES, *argv]
+    return subprocess.call(command)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,210 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from beeai_framework.agents.base import BaseAgent
+from beeai_framework.agents.errors import AgentError
+from beeai_framework.agents.types import AgentExecutionConfig, ExecutionPreset
+from beeai_framework.backend.message import UserMessage
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.memory import BaseMemory, SlidingCache, UnconstrainedMemory
+from beeai_framework.utils.models import ModelLike, to_model
+
+"""
+Utility functions and classes
+"""
+
+
+class EchoInput(BaseModel):
+    prompt: str | None = None
+
+
+class EchoOptions(BaseModel):
+    pass
+
+
+class EchoOutput(BaseModel):
+    text: str
+    steps: list[str] = []
+
+
+class EchoAgent(BaseAgent[EchoInput, EchoOptions, EchoOutput]):
+    """Trivial agent that echoes the prompt and counts `_run` invocations."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__()
+        self.calls = 0
+        self.delay = delay
+        self._memory: BaseMemory = UnconstrainedMemory()
+        self.emitter = Emitter.root().child(
+            namespace=["agent", "echo"],
+            creator=self,
+        )
+
+    async def _run(
+        self, run_input: ModelLike[EchoInput], options: ModelLike[EchoOptions] | None, context: RunContext
+    ) -> EchoOutput:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        prompt = run_input["prompt"] if isinstance(run_input, dict) else run_input.prompt
+        return EchoOutput(text=str(prompt), steps=[str(prompt)])
+
+    @property
+    def memory(self) -> BaseMemory:
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: BaseMemory) -> None:
+        self._memory = memory
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_not_cached_by_default() -> None:
+    agent = EchoAgent()
+
+    await agent.run(prompt="Hello!")
+    await agent.run(prompt="Hello!")
+
+    assert agent.calls == 2
+
+
+@pytest.mark.unit
+def test_execution_presets_pass_through_untouched() -> None:
+    assert to_model(AgentExecutionConfig, ExecutionPreset.DEFAULT) is ExecutionPreset.DEFAULT
+
+    with pytest.raises(ValidationError):
+        ExecutionPreset.DEFAULT.max_iterations = 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_cache_short_circuits_run() -> None:
+    agent = EchoAgent()
+    agent.run_cache = SlidingCache(size=10)
+
+    first: EchoOutput = await agent.run(prompt="Translate 'Hello' to German.")
+    second: EchoOutput = await agent.run(prompt="Translate 'Hello' to German.")
+    normalized: EchoOutput = await agent.run(prompt="  translate 'hello'   to german.  ")
+
+    assert agent.calls == 1
+    assert first.text == second.text == normalized.text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_cache_hits_are_isolated_copies() -> None:
+    agent = EchoAgent()
+    agent.run_cache = SlidingCache(size=10)
+
+    first: EchoOutput = await agent.run(prompt="Hello!")
+    first.steps.append("mutated by the first caller")
+    second: EchoOutput = await agent.run(prompt="Hello!")
+
+    assert agent.calls == 1
+    assert second.steps == ["Hello!"]  # the cached entry did not absorb the mutation
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_cache_invalidated_by_memory_changes() -> None:
+    agent = EchoAgent()
+    agent.run_cache = SlidingCache(size=10)
+
+    await agent.run(prompt="Hello!")
+    await agent.memory.add(UserMessage(content="Some new conversation context."))
+    await agent.run(prompt="Hello!")
+
+    assert agent.calls == 2  # the memory fingerprint changed, so the entry did not replay
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_deduplicates_inflight_prompts() -> None:
+    agent = EchoAgent(delay=0.01)
+    agent.run_cache = SlidingCache(size=10)
+
+    first, second = await asyncio.gather(agent.run(prompt="Hello!"), agent.run(prompt="Hello!"))
+
+    assert agent.calls == 1
+    assert first.text == second.text == "Hello!"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_unawaited_run_does_not_block_others() -> None:
+    agent = EchoAgent()
+    agent.run_cache = SlidingCache(size=10)
+
+    first = agent.run(prompt="Hello!")
+    second = agent.run(prompt="Hello!")
+
+    # awaiting the later Run first must not hang on the never-started one
+    result: EchoOutput = await asyncio.wait_for(second, timeout=1)
+    assert result.text == "Hello!"
+
+    late: EchoOutput = await asyncio.wait_for(first, timeout=1)
+    assert late.text == "Hello!"
+    assert agent.calls == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_concurrent_distinct_prompts_still_error() -> None:
+    agent = EchoAgent(delay=0.01)
+    agent.run_cache = SlidingCache(size=10)
+
+    with pytest.raises(AgentError, match="already running"):
+        await asyncio.gather(agent.run(prompt="Hello!"), agent.run(prompt="Goodbye!"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_running_is_instance_state() -> None:
+    first = EchoAgent(delay=0.05)
+    second = EchoAgent()
+
+    task = asyncio.ensure_future(first.run(prompt="Hello!"))
+    await asyncio.sleep(0.01)
+
+    assert first.is_running
+    assert not second.is_running
+
+    await task
+    assert not first.is_running
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_run_cache_respects_enabled_flag() -> None:
+    agent = EchoAgent()
+    agent.run_cache = SlidingCache(size=10)
+    agent.run_cache.enabled = False
+
+    await agent.run(prompt="Hello!")
+    await agent.run(prompt="Hello!")
+
+    assert agent.calls == 2
@@ -33,6 +33,23 @@ from beeai_framework.emitter import Emitter
 from beeai_framework.memory.token_memory import TokenMemory
 from beeai_framework.tools.weather.openmeteo import OpenMeteoTool
 
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_system_prompt_cached_across_runs() -> None:
+    llm: ChatModel = ChatModel.from_name("ollama:granite3.1-dense:8b")
+
+    input = ReActAgentInput(llm=llm, tools=[OpenMeteoTool()], memory=TokenMemory(llm))
+    first_runner = DefaultRunner(input=input, options=ReActAgentRunOptions(), run=None)  # TODO Figure out run
+    second_runner = DefaultRunner(input=input, options=ReActAgentRunOptions(), run=None)  # TODO Figure out run
+
+    # the rendered prefix is cached on the shared agent input, not per runner
+    assert first_runner.system_prompt() is second_runner.system_prompt()
+
+
 """
 E2E Tests
 """
@@ -52,3 +52,28 @@ async def test_tool_emitter() -> None:
     query = "Hello!"
     result: StringToolOutput = await test_tool.run({"query": query}).observe(observer)
     assert result.get_text_content() == query
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emitter_raising_listener_does_not_stop_dispatch() -> None:
+    emitter = Emitter(namespace=["app"])
+    seen: list[str] = []
+
+    async def async_listener(data: Any, event: EventMeta) -> None:
+        seen.append("async")
+
+    def failing_listener(data: Any, event: EventMeta) -> None:
+        raise ValueError("boom")
+
+    def sync_listener(data: Any, event: EventMeta) -> None:
+        seen.append("sync")
+
+    emitter.on("update", async_listener)
+    emitter.on("update", failing_listener)
+    emitter.on("update", sync_listener)
+
+    with pytest.raises(ValueError, match="boom"):
+        await emitter.emit("update", {})
+
+    assert sorted(seen) == ["async", "sync"]  # the other listeners still fired
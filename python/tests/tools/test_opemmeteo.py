@@ -73,6 +73,19 @@ async def test_output(tool: OpenMeteoTool) -> None:
     assert "current" in result.get_text_content()
 
 
+@pytest.mark.e2e
+@pytest.mark.asyncio
+async def test_run_many(tool: OpenMeteoTool) -> None:
+    results = await tool.run_many(
+        inputs=[
+            {"location_name": "White Plains"},
+            OpenMeteoToolInput(location_name="Cambridge", country="US", temperature_unit="fahrenheit"),
+        ]
+    )
+    assert len(results) == 2
+    assert all("current" in result.get_text_content() for result in results)
+
+
 @pytest.mark.e2e
 @pytest.mark.asyncio
 async def test_bad_start_date_format(tool: OpenMeteoTool) -> None:
@@ -0,0 +1,61 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from beeai_framework.utils.asynchronous import asyncify
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_asyncify_runs_off_the_event_loop_thread() -> None:
+    def blocking(value: int) -> tuple[int, str]:
+        return value * 2, threading.current_thread().name
+
+    result, thread_name = await asyncify(blocking)(21)
+
+    assert result == 42
+    assert thread_name != threading.current_thread().name
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_asyncify_calls_overlap_under_gather() -> None:
+    def blocking() -> None:
+        time.sleep(0.05)
+
+    started = time.monotonic()
+    await asyncio.gather(asyncify(blocking)(), asyncify(blocking)(), asyncify(blocking)())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.15  # three blocking sleeps ran concurrently, not back-to-back
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_asyncify_propagates_exceptions() -> None:
+    def blocking() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await asyncify(blocking)()
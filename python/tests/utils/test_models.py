@@ -0,0 +1,103 @@
+# Copyright 2025 IBM Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from pydantic import BaseModel, Field
+
+from beeai_framework.utils.models import to_model, to_model_optional
+
+"""
+Utility functions and classes
+"""
+
+
+class ExampleConfig(BaseModel):
+    retries: int | None = None
+    label: str = "default"
+    nested: dict[str, int] | None = None
+
+
+class ExampleHolder(BaseModel):
+    config: ExampleConfig | None = None
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_to_model_returns_instance_unchanged() -> None:
+    instance = ExampleConfig(retries=2)
+    assert to_model(ExampleConfig, instance) is instance
+
+
+@pytest.mark.unit
+def test_to_model_validates_dict() -> None:
+    model = to_model(ExampleConfig, {"retries": 3, "label": "fast"})
+    assert model == ExampleConfig(retries=3, label="fast")
+
+
+@pytest.mark.unit
+def test_to_model_caches_literal_dicts_without_sharing() -> None:
+    first = to_model(ExampleConfig, {"retries": 1, "nested": {"a": 1}})
+    second = to_model(ExampleConfig, {"retries": 1, "nested": {"a": 1}})
+
+    assert first == second
+    assert first is not second  # cached hits are copied, not shared
+
+    first.retries = 99
+    assert second.retries == 1
+
+    # nested containers must be private to each caller, too
+    assert first.nested is not None
+    first.nested["a"] = 999
+    assert second.nested == {"a": 1}
+    assert to_model(ExampleConfig, {"retries": 1, "nested": {"a": 1}}).nested == {"a": 1}
+
+
+@pytest.mark.unit
+def test_to_model_skips_caching_models_with_default_factories() -> None:
+    class StampedConfig(BaseModel):
+        retries: int
+        tags: list[str] = Field(default_factory=list)
+
+    first = to_model(StampedConfig, {"retries": 1})
+    first.tags.append("one")
+    second = to_model(StampedConfig, {"retries": 1})
+
+    assert second.tags == []  # the factory ran again instead of replaying a cached value
+
+
+@pytest.mark.unit
+def test_to_model_cache_distinguishes_bool_from_int() -> None:
+    class FlagModel(BaseModel):
+        value: int | bool
+
+    assert to_model(FlagModel, {"value": 1}).value == 1
+    assert to_model(FlagModel, {"value": True}).value is True
+
+
+@pytest.mark.unit
+def test_to_model_handles_unfreezable_values() -> None:
+    config = ExampleConfig(retries=5)
+    holder = to_model(ExampleHolder, {"config": config})
+    assert holder.config is not None
+    assert holder.config.retries == 5
+
+
+@pytest.mark.unit
+def test_to_model_optional_none_passthrough() -> None:
+    assert to_model_optional(ExampleConfig, None) is None
@@ -12,14 +12,167 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from typing import Any
+
 import pytest
+import pytest_asyncio
+from pydantic import BaseModel, InstanceOf
 
 from beeai_framework.adapters.ollama.backend.chat import OllamaChatModel
+from beeai_framework.agents.base import BaseAgent
 from beeai_framework.agents.react import ReActAgent
 from beeai_framework.agents.types import AgentMeta
-from beeai_framework.backend.message import UserMessage
-from beeai_framework.memory import TokenMemory, UnconstrainedMemory
+from beeai_framework.backend.message import AssistantMessage, UserMessage
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.memory import BaseMemory, TokenMemory, UnconstrainedMemory
+from beeai_framework.utils.asynchronous import use_eager_task_factory
+from beeai_framework.utils.models import ModelLike
 from beeai_framework.workflows.agent import AgentFactoryInput, AgentWorkflow
+from beeai_framework.workflows.errors import WorkflowError
+
+"""
+Utility functions and classes
+"""
+
+
+class StubInput(BaseModel):
+    prompt: str | None = None
+
+
+class StubOutput(BaseModel):
+    result: InstanceOf[AssistantMessage]
+
+
+class StubAgent(BaseAgent[StubInput, StubInput, StubOutput]):
+    """Agent that just sleeps and records when it ran, for scheduler tests."""
+
+    def __init__(self, name: str, tracker: dict[str, Any], delay: float = 0.01) -> None:
+        super().__init__()
+        self._name = name
+        self._tracker = tracker
+        self._delay = delay
+        self._memory: BaseMemory = UnconstrainedMemory()
+        self.emitter = Emitter.root().child(
+            namespace=["agent", "stub"],
+            creator=self,
+        )
+
+    async def _run(
+        self, run_input: ModelLike[StubInput], options: ModelLike[StubInput] | None, context: RunContext
+    ) -> StubOutput:
+        self._tracker["active"] += 1
+        self._tracker["max_active"] = max(self._tracker["max_active"], self._tracker["active"])
+        await asyncio.sleep(self._delay)
+        self._tracker["active"] -= 1
+        self._tracker["finished"].append(self._name)
+        return StubOutput(result=AssistantMessage(f"{self._name} done"))
+
+    @property
+    def memory(self) -> BaseMemory:
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: BaseMemory) -> None:
+        self._memory = memory
+
+    @property
+    def meta(self) -> AgentMeta:
+        return AgentMeta(name=self._name, description="", tools=[])
+
+
+def stub_tracker() -> dict[str, Any]:
+    return {"active": 0, "max_active": 0, "finished": []}
+
+
+@pytest.fixture(scope="module")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the workflow tests on uvloop when available."""
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def eager_task_factory() -> None:
+    """Schedule tasks eagerly (Python 3.12+) so short coroutines avoid a scheduler round-trip."""
+    use_eager_task_factory()
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_multi_agents_workflow_independent_steps_run_in_parallel() -> None:
+    tracker = stub_tracker()
+
+    workflow: AgentWorkflow = AgentWorkflow()
+    workflow.add_agent(StubAgent("first", tracker), depends_on=[])
+    workflow.add_agent(StubAgent("second", tracker), depends_on=[])
+    workflow.add_agent(StubAgent("third", tracker), depends_on=[])
+
+    response = await workflow.run([UserMessage(content="Hello!")])
+
+    assert tracker["max_active"] == 3
+    # the merged state stays in declaration order regardless of finish order
+    assert [message.text for message in response.state.new_messages] == [
+        "Assistant Name: first\nAssistant Response: first done",
+        "Assistant Name: second\nAssistant Response: second done",
+        "Assistant Name: third\nAssistant Response: third done",
+    ]
+    assert response.state.final_answer == "third done"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_multi_agents_workflow_depends_on_layers() -> None:
+    tracker = stub_tracker()
+
+    workflow: AgentWorkflow = AgentWorkflow()
+    workflow.add_agent(StubAgent("writer", tracker), depends_on=[])
+    workflow.add_agent(StubAgent("translator_de", tracker), depends_on=["writer"])
+    workflow.add_agent(StubAgent("translator_it", tracker), depends_on=["writer"])
+    workflow.add_agent(StubAgent("reviewer", tracker), depends_on=["translator_de", "translator_it"])
+
+    response = await workflow.run([UserMessage(content="Hello!")])
+
+    assert tracker["finished"][0] == "writer"
+    assert tracker["finished"][-1] == "reviewer"
+    assert tracker["max_active"] == 2  # the two translators overlapped
+    assert response.state.final_answer == "reviewer done"
+    assert len(response.state.new_messages) == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_multi_agents_workflow_invalid_dependencies() -> None:
+    tracker = stub_tracker()
+
+    workflow: AgentWorkflow = AgentWorkflow()
+    workflow.add_agent(StubAgent("first", tracker), depends_on=["second"])
+    workflow.add_agent(StubAgent("second", tracker), depends_on=["first"])
+
+    with pytest.raises(WorkflowError):
+        await workflow.run([UserMessage(content="Hello!")])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_multi_agents_workflow_unknown_dependency() -> None:
+    tracker = stub_tracker()
+
+    workflow: AgentWorkflow = AgentWorkflow()
+    workflow.add_agent(StubAgent("first", tracker), depends_on=["missing"])
+
+    with pytest.raises(WorkflowError):
+        await workflow.run([UserMessage(content="Hello!")])
+
 
 """
 E2E Tests